@@ -1,16 +1,34 @@
 from urllib.parse import unquote, urlparse, parse_qs
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
 import argparse
+import errno
 import sys
 from tqdm import tqdm
 import os
 import re
+import shutil
+import socket
+import threading
+import queue
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+_PATH_ID = re.compile(r'/d/([\w-]+)')
+_TITLE_RE = re.compile(r'(?:^|&)title=([^&]*)')
+_VIDEO_RE = re.compile(r'(?:^|&)(?!title=)([^&]*videoplayback[^&]*)')
+# Filename cleanup table: '+' becomes a space, invalid and control characters are dropped
+_FILENAME_TABLE = {ord(c): None for c in '<>:"/\\|?*'}
+_FILENAME_TABLE.update({i: None for i in range(32)})
+_FILENAME_TABLE[ord('+')] = ord(' ')
+
 def extract_video_id(link_or_id: str) -> str:
     """Extract video ID whether input is a full Google Drive link or just an ID."""
     # Case 1: Already looks like an ID
-    if re.match(r'^[\w-]{20,}$', link_or_id):  # Drive IDs are usually long (25+ chars)
+    # Drive IDs are usually long (25+ chars); a URL fails the scan at its first ':' or '/'
+    if len(link_or_id) >= 20 and all(c.isalnum() or c in '_-' for c in link_or_id):
         return link_or_id
     
     # Case 2: It's a link, try to parse
@@ -18,7 +36,7 @@ def extract_video_id(link_or_id: str) -> str:
     query = parse_qs(parsed.query)
 
     # Link format: https://drive.google.com/file/d/<ID>/view
-    match = re.search(r'/d/([\w-]+)', parsed.path)
+    match = _PATH_ID.search(parsed.path)
     if match:
         return match.group(1)
 
@@ -29,27 +47,115 @@ def extract_video_id(link_or_id: str) -> str:
     # Fallback: return input
     return link_or_id
 
+INFO_DRAIN_LIMIT = 1024 * 1024  # Max leftover info bytes read to keep the connection reusable
+
+def fetch_video_info(session: requests.Session, drive_url: str) -> str:
+    """Streams the get_video_info response, stopping once the title and playback URL are complete."""
+    buffer = bytearray()
+    with session.get(drive_url, stream=True) as response:
+        for part in response.iter_content(8192):
+            buffer += part
+            if b'videoplayback' not in buffer or b'title=' not in buffer:
+                continue
+            text = buffer.decode('utf-8', errors='replace')
+            title_match, video_match = _TITLE_RE.search(text), _VIDEO_RE.search(text)
+            # A match touching the end of the buffer may still be cut off
+            if title_match and video_match and max(title_match.end(), video_match.end()) < len(text):
+                # Closing an unread response drops the socket; drain the small rest so it returns to the pool
+                drained = 0
+                for rest in response.iter_content(65536):
+                    drained += len(rest)
+                    if drained > INFO_DRAIN_LIMIT:
+                        break
+                return text
+    return buffer.decode('utf-8', errors='replace')
+
 def get_video_url(page_content: str, verbose: bool) -> tuple[str, str]:
     """Extracts the video playback URL and title from the page content."""
     if verbose:
-        print("[INFO] Parsing video playback URL and title.")
-    contentList = page_content.split("&")
+        tqdm.write("[INFO] Parsing video playback URL and title.")
     video, title = None, None
-    for content in contentList:
-        if content.startswith('title=') and not title:
-            title = unquote(content.split('=')[-1])
-        elif "videoplayback" in content and not video:
-            video = unquote(content).split("|")[-1]
-        if video and title:
-            break
+    # Scan the raw query string once instead of splitting it on every '&'
+    title_match = _TITLE_RE.search(page_content)
+    if title_match:
+        title = unquote(title_match.group(1).split('=')[-1])
+    video_match = _VIDEO_RE.search(page_content)
+    if video_match:
+        video = unquote(video_match.group(1)).split("|")[-1]
 
     if verbose:
-        print(f"[INFO] Video URL: {video}")
-        print(f"[INFO] Video Title: {title}")
+        tqdm.write(f"[INFO] Video URL: {video}")
+        tqdm.write(f"[INFO] Video Title: {title}")
     return video, title
 
-def download_file(url: str, cookies: dict, filename: str, chunk_size: int, verbose: bool) -> None:
-    """Single-threaded download with resume support."""
+DROP_CACHE_EVERY = 64 * 1024 * 1024  # Bytes written between page cache drops
+PROGRESS_STEP = 1024 * 1024  # Bytes accumulated before each progress bar update
+
+def advise(fd: int, offset: int, length: int, advice_name: str) -> None:
+    """Passes a posix_fadvise hint for the given region; a no-op where unsupported."""
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(fd, offset, length, getattr(os, advice_name))
+
+class CacheDropper:
+    """Evicts finished regions from the page cache, lagging `lag` regions behind the writer."""
+
+    def __init__(self, fd: int, lag: int):
+        self.fd = fd
+        self.lag = lag
+        self.lock = threading.Lock()
+        self.regions = deque()
+
+    def finished(self, offset: int, length: int) -> None:
+        with self.lock:
+            self.regions.append((offset, length))
+            if len(self.regions) <= self.lag:
+                return
+            offset, length = self.regions.popleft()
+        # DONTNEED skips dirty pages; by now the kernel has had time to write this region back
+        advise(self.fd, offset, length, "POSIX_FADV_DONTNEED")
+
+def preallocate(fd: int, size: int) -> None:
+    """Reserves size bytes up front so the filesystem can lay the file out in few extents."""
+    try:
+        os.posix_fallocate(fd, 0, size)
+    except AttributeError:  # Not available on this platform
+        os.ftruncate(fd, size)
+    except OSError as e:
+        if e.errno not in (errno.EOPNOTSUPP, errno.EINVAL):  # ENOSPC, EFBIG etc. must surface now
+            raise
+        os.ftruncate(fd, size)  # Not supported by this filesystem
+
+class ProgressWriter:
+    """Write-only file wrapper that updates a progress bar and drops written pages from the cache."""
+
+    def __init__(self, file, pbar: tqdm):
+        self.file = file
+        self.pbar = pbar
+        self.written = self.dropped = file.tell()
+        self.pending = 0
+        self.dropper = CacheDropper(file.fileno(), 1)
+
+    def write(self, data: bytes) -> int:
+        count = self.file.write(data)
+        self.written += len(data)
+        self.pending += len(data)
+        if self.pending >= PROGRESS_STEP:
+            self.flush_progress()
+        if self.written - self.dropped >= DROP_CACHE_EVERY:
+            # The file is never read back, so its cached pages are wasted memory
+            self.file.flush()
+            self.dropper.finished(self.dropped, self.written - self.dropped)
+            self.dropped = self.written
+        return count
+
+    def flush_progress(self) -> None:
+        """Reports bytes written since the last progress bar update."""
+        if self.pending:
+            self.pbar.update(self.pending)
+            self.pending = 0
+
+def download_file(url: str, session: requests.Session, filename: str, chunk_size: int, verbose: bool, position: int = None) -> bool:
+    """Single-threaded download with resume support. Returns True on success."""
     headers = {}
     file_mode = 'wb'
 
@@ -60,120 +166,315 @@ def download_file(url: str, cookies: dict, filename: str, chunk_size: int, verbo
         file_mode = 'ab'
 
     if verbose:
-        print(f"[INFO] Starting download from {url}")
+        tqdm.write(f"[INFO] Starting download from {url}")
         if downloaded_size > 0:
-            print(f"[INFO] Resuming download from byte {downloaded_size}")
-
-    response = requests.get(url, stream=True, cookies=cookies, headers=headers)
-    if response.status_code in (200, 206):
-        total_size = int(response.headers.get('content-length', 0)) + downloaded_size
-        with open(filename, file_mode) as file:
-            with tqdm(total=total_size, initial=downloaded_size, unit='B', unit_scale=True, desc=filename, file=sys.stdout) as pbar:
-                for chunk in response.iter_content(chunk_size=chunk_size):
-                    if chunk:
-                        file.write(chunk)
-                        pbar.update(len(chunk))
-        print(f"\n{filename} downloaded successfully.")
-    else:
-        print(f"Error downloading {filename}, status code: {response.status_code}")
+            tqdm.write(f"[INFO] Resuming download from byte {downloaded_size}")
+
+    with session.get(url, stream=True, headers=headers) as response:
+        if response.status_code in (200, 206):
+            total_size = int(response.headers.get('content-length', 0)) + downloaded_size
+            response.raw.decode_content = True
+            with open(filename, file_mode, buffering=1 << 20) as file:
+                advise(file.fileno(), 0, 0, "POSIX_FADV_SEQUENTIAL")
+                with tqdm(total=total_size, initial=downloaded_size, unit='B', unit_scale=True, desc=filename, file=sys.stdout, mininterval=0.2, position=position) as pbar:
+                    writer = ProgressWriter(file, pbar)
+                    try:
+                        # Copy straight from the raw stream; the wrapper handles progress and cache hints
+                        shutil.copyfileobj(response.raw, writer, length=chunk_size)
+                    finally:
+                        writer.flush_progress()
+            tqdm.write(f"\n{filename} downloaded successfully.")
+            return True
+        tqdm.write(f"Error downloading {filename}, status code: {response.status_code}")
+        return False
+
+class RangeNotSupported(Exception):
+    """Raised when the server ignores a Range header and returns the whole file."""
+
+SEGMENT_SIZE = 16 * 1024 * 1024  # Size of each range request in parallel mode
+WRITE_BATCH = 4 * 1024 * 1024  # Bytes buffered by a range worker before each positioned write
+
+_seek_lock = threading.Lock()
 
-def fetch_range(url: str, cookies: dict, start: int, end: int, part_file: str, verbose: bool) -> None:
-    """Download a specific byte range into a part file."""
+def write_at(fd: int, data: bytes, offset: int) -> None:
+    """Write all of data at offset without disturbing other writers of the same fd."""
+    view = memoryview(data)
+    if hasattr(os, "pwrite"):
+        while view:
+            written = os.pwrite(fd, view, offset)
+            view = view[written:]
+            offset += written
+        return
+    with _seek_lock:  # No pwrite (e.g. Windows): serialize seek + write
+        os.lseek(fd, offset, os.SEEK_SET)
+        while view:
+            view = view[os.write(fd, view):]
+
+def write_range(response: requests.Response, start: int, fd: int, pbar: tqdm, lock: threading.Lock, dropper: CacheDropper) -> None:
+    """Write a 206 response body straight into its offset of the output file."""
+    with response:
+        buffer = bytearray()
+        offset = start
+        for chunk in response.iter_content(1024 * 256):  # 256KB buffer
+            if chunk:
+                buffer += chunk
+                if len(buffer) >= WRITE_BATCH:
+                    write_at(fd, buffer, offset)
+                    offset += len(buffer)
+                    with lock:  # One progress update per batch rather than per chunk
+                        pbar.update(len(buffer))
+                    buffer.clear()
+        if buffer:
+            write_at(fd, buffer, offset)
+            offset += len(buffer)
+            with lock:
+                pbar.update(len(buffer))
+        dropper.finished(start, offset - start)
+
+def fetch_range(url: str, session: requests.Session, start: int, end: int, fd: int, pbar: tqdm, lock: threading.Lock, dropper: CacheDropper, verbose: bool) -> None:
+    """Download a specific byte range straight into its offset of the output file."""
     headers = {"Range": f"bytes={start}-{end}"}
     if verbose:
-        print(f"[INFO] Downloading range {start}-{end}")
-    response = requests.get(url, stream=True, headers=headers, cookies=cookies)
-    if response.status_code in (200, 206):
-        with open(part_file, "wb") as f:
-            for chunk in response.iter_content(1024 * 256):  # 256KB buffer
-                if chunk:
-                    f.write(chunk)
-    else:
+        tqdm.write(f"[INFO] Downloading range {start}-{end}")
+    response = session.get(url, stream=True, headers=headers)
+    if response.status_code == 200:
+        response.close()
+        raise RangeNotSupported(f"Server ignored range {start}-{end}")
+    if response.status_code != 206:
+        response.close()
         raise Exception(f"Failed to download range {start}-{end}, status {response.status_code}")
+    write_range(response, start, fd, pbar, lock, dropper)
 
-def parallel_download_file(url: str, cookies: dict, filename: str, num_threads: int, verbose: bool) -> None:
-    """Download a file in parallel using multiple threads and range requests."""
-    # First get file size
-    head = requests.head(url, cookies=cookies)
-    if "content-length" not in head.headers:
-        print("[WARN] Could not determine file size, falling back to single-thread download.")
-        return download_file(url, cookies, filename, 1024*256, verbose)
+def parallel_download_file(url: str, session: requests.Session, filename: str, num_threads: int, verbose: bool, position: int = None) -> bool:
+    """Download a file in parallel using multiple threads and range requests. Returns True on success."""
+    # The first segment doubles as the probe: its Content-Range carries the total size
+    if verbose:
+        tqdm.write(f"[INFO] Downloading range 0-{SEGMENT_SIZE - 1}")
+    first = session.get(url, stream=True, headers={"Range": f"bytes=0-{SEGMENT_SIZE - 1}"})
+    content_range = first.headers.get("content-range", "")
+    if first.status_code != 206 or not content_range.rpartition("/")[2].isdigit():
+        first.close()
+        if first.status_code not in (200, 206):
+            tqdm.write(f"Error downloading {filename}, status code: {first.status_code}")
+            return False
+        tqdm.write("[WARN] Server does not support range requests, falling back to single-thread download.")
+        return download_file(url, session, filename, 1024*256, verbose, position)
 
-    total_size = int(head.headers["content-length"])
-    part_size = total_size // num_threads
+    total_size = int(content_range.rpartition("/")[2])
+    first_end = min(SEGMENT_SIZE, total_size) - 1
+    remaining = total_size - first_end - 1
+    # Many small segments instead of one per thread: each worker picks up the next
+    # range as soon as it finishes, so num_threads requests are always in flight.
+    num_parts = min(max(num_threads - 1, -(-remaining // SEGMENT_SIZE)), remaining)
     futures = []
-    part_files = []
 
     if verbose:
-        print(f"[INFO] Total size: {total_size} bytes")
-        print(f"[INFO] Splitting into {num_threads} parts of ~{part_size} bytes each")
-
-    with ThreadPoolExecutor(max_workers=num_threads) as executor:
-        for i in range(num_threads):
-            start = i * part_size
-            end = (start + part_size - 1) if i < num_threads - 1 else total_size - 1
-            part_file = f"{filename}.part{i}"
-            part_files.append(part_file)
-            futures.append(executor.submit(fetch_range, url, cookies, start, end, part_file, verbose))
+        tqdm.write(f"[INFO] Total size: {total_size} bytes")
+        tqdm.write(f"[INFO] Splitting into {num_parts + 1} parts of up to {SEGMENT_SIZE} bytes each across {num_threads} threads")
 
-        for future in as_completed(futures):
-            future.result()  # raises exception if any failed
+    # Work on a side file so a failed download never leaves a full-size file with holes under the real name
+    part_name = filename + ".part"
+    lock = threading.Lock()
+    try:
+        # Preallocate so every worker can write at its own offset through one shared descriptor
+        with open(part_name, "wb") as out:
+            fd = out.fileno()
+            preallocate(fd, total_size)
+            dropper = CacheDropper(fd, num_threads)  # About one window of segments behind
+            with tqdm(total=total_size, unit='B', unit_scale=True, desc=filename, file=sys.stdout, mininterval=0.2, position=position) as pbar:
+                with ThreadPoolExecutor(max_workers=num_threads) as executor:
+                    futures.append(executor.submit(write_range, first, 0, fd, pbar, lock, dropper))
+                    for i in range(num_parts):
+                        start = first_end + 1 + i * remaining // num_parts
+                        end = first_end + (i + 1) * remaining // num_parts
+                        futures.append(executor.submit(fetch_range, url, session, start, end, fd, pbar, lock, dropper, verbose))
 
-    # Merge parts
-    with open(filename, "wb") as outfile:
-        for part_file in part_files:
-            with open(part_file, "rb") as pf:
-                outfile.write(pf.read())
-            os.remove(part_file)
+                    try:
+                        for future in as_completed(futures):
+                            future.result()  # raises exception if any failed
+                    except BaseException:
+                        for future in futures:
+                            future.cancel()
+                        raise
+    except RangeNotSupported:
+        tqdm.write("[WARN] Server does not support range requests, falling back to single-thread download.")
+        os.remove(part_name)
+        return download_file(url, session, filename, 1024*256, verbose, position)
+    except BaseException:
+        first.close()
+        if os.path.exists(part_name):
+            os.remove(part_name)
+        raise
 
-    print(f"\n{filename} downloaded successfully with {num_threads} threads.")
+    os.replace(part_name, filename)
+    tqdm.write(f"\n{filename} downloaded successfully with {num_threads} threads.")
+    return True
 
 def sanitize_filename(filename: str) -> str:
     """Sanitizes the filename by removing invalid characters and normalizing."""
-    filename = filename.replace('+', ' ')  # Replace '+' with spaces
-    filename = re.sub(r'[<>:"/\\|?*]', '', filename)  # Remove invalid characters
-    filename = "".join(char for char in filename if ord(char) >= 32)  # Remove control chars
-    filename = filename.strip()
+    filename = filename.translate(_FILENAME_TABLE).strip()
     if not os.path.splitext(filename)[1]:
         filename += ".mp4"
     return filename
 
-def main(video_input: str, output_file: str = None, chunk_size: int = 1024, verbose: bool = False, threads: int = 1) -> None:
-    """Main function to process video input (link or ID) and download the video file."""
+# SO_RCVBUF size; 0 keeps the OS default. An explicit value disables Linux receive-buffer
+# autotuning and is capped by net.core.rmem_max, so only raise it after tuning the kernel.
+DEFAULT_SOCKET_BUFFER = 0
+
+class SocketTunedAdapter(HTTPAdapter):
+    """HTTPAdapter whose sockets can get a fixed, larger receive buffer for high-BDP links."""
+
+    def __init__(self, *args, socket_buffer: int = DEFAULT_SOCKET_BUFFER, **kwargs):
+        self.socket_buffer = socket_buffer  # Must be set before HTTPAdapter builds the pool manager
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        options = list(HTTPConnection.default_socket_options)  # Keeps TCP_NODELAY
+        if self.socket_buffer > 0:
+            options.append((socket.SOL_SOCKET, socket.SO_RCVBUF, self.socket_buffer))
+        kwargs["socket_options"] = options
+        super().init_poolmanager(*args, **kwargs)
+
+def create_session(pool_size: int = 16, socket_buffer: int = DEFAULT_SOCKET_BUFFER) -> requests.Session:
+    """Creates a session that reuses connections and cookies across all requests."""
+    session = requests.Session()
+    # raise_on_status=False hands the last response back so callers can report its status code
+    retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504], raise_on_status=False)
+    adapter = SocketTunedAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retries, socket_buffer=socket_buffer)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+class FilenameRegistry:
+    """Hands out output filenames in batch-file order so every rerun maps each video to the same file."""
+
+    def __init__(self):
+        self.turn = threading.Condition()
+        self.next_index = 0
+        self.finished = set()
+        self.claimed = set()
+
+    def claim(self, index: int, filename: str, video_id: str) -> str:
+        """Waits until every earlier entry has claimed, then returns filename or 'name (video_id).ext' if taken."""
+        base, ext = os.path.splitext(filename)
+        with self.turn:
+            self.turn.wait_for(lambda: self.next_index >= index)
+            candidate = filename if filename not in self.claimed else f"{base} ({video_id}){ext}"
+            self.claimed.add(candidate)
+            self._finish(index)
+        return candidate
+
+    def release(self, index: int) -> None:
+        """Lets later entries claim even if this one failed before choosing a name."""
+        with self.turn:
+            self._finish(index)
+
+    def _finish(self, index: int) -> None:
+        self.finished.add(index)
+        while self.next_index in self.finished:
+            self.next_index += 1
+        self.turn.notify_all()
+
+def download_video(session: requests.Session, video_input: str, output_file: str, chunk_size: int, verbose: bool, threads: int, names: FilenameRegistry = None, index: int = None, position: int = None) -> bool:
+    """Fetches the info for one video (link or ID) and downloads it over the given session. Returns True on success."""
     video_id = extract_video_id(video_input)
     drive_url = f'https://drive.google.com/u/0/get_video_info?docid={video_id}&drive_originator_app=303'
     
     if verbose:
-        print(f"[INFO] Accessing {drive_url}")
+        tqdm.write(f"[INFO] Accessing {drive_url}")
 
-    response = requests.get(drive_url)
-    page_content = response.text
-    cookies = response.cookies.get_dict()
+    page_content = fetch_video_info(session, drive_url)
 
     video, title = get_video_url(page_content, verbose)
 
     filename = output_file if output_file else title
     filename = sanitize_filename(filename)
+    if names is not None:
+        filename = names.claim(index, filename, video_id)
     
     if verbose and filename != (output_file if output_file else title):
-        print(f"[INFO] Filename sanitized to: {filename}")
+        tqdm.write(f"[INFO] Filename sanitized to: {filename}")
 
     if video:
         if threads > 1:
-            parallel_download_file(video, cookies, filename, threads, verbose)
-        else:
-            download_file(video, cookies, filename, chunk_size, verbose)
-    else:
-        print("Unable to retrieve the video URL. Ensure the video link/ID is correct and accessible.")
+            return parallel_download_file(video, session, filename, threads, verbose, position)
+        return download_file(video, session, filename, chunk_size, verbose, position)
+    tqdm.write("Unable to retrieve the video URL. Ensure the video link/ID is correct and accessible.")
+    return False
+
+def main(video_input: str, output_file: str = None, chunk_size: int = 65536, verbose: bool = False, threads: int = 1, socket_buffer: int = DEFAULT_SOCKET_BUFFER) -> bool:
+    """Main function to process video input (link or ID) and download the video file."""
+    session = create_session(max(16, threads), socket_buffer)
+    return download_video(session, video_input, output_file, chunk_size, verbose, threads)
+
+def batch_main(batch_file: str, chunk_size: int = 65536, verbose: bool = False, threads: int = 1, socket_buffer: int = DEFAULT_SOCKET_BUFFER, concurrency: int = 2) -> int:
+    """Downloads every video listed in batch_file, several at a time over one shared session. Returns the failure count."""
+    with open(batch_file) as f:
+        lines = [line.strip() for line in f if line.strip() and not line.strip().startswith('#')]
+
+    # The same video listed twice would otherwise be downloaded again as 'name (1).ext'
+    video_inputs, seen_ids = [], set()
+    for line in lines:
+        video_id = extract_video_id(line)
+        if video_id not in seen_ids:
+            seen_ids.add(video_id)
+            video_inputs.append(line)
+
+    if verbose:
+        tqdm.write(f"[INFO] {len(video_inputs)} videos queued, {concurrency} at a time")
+
+    session = create_session(max(16, threads * concurrency), socket_buffer)
+    names = FilenameRegistry()
+    # Each running download takes a free progress bar row and gives it back when done
+    rows = queue.Queue()
+    for row in range(concurrency):
+        rows.put(row)
+
+    def run(index: int, video_input: str) -> bool:
+        row = rows.get()
+        try:
+            return download_video(session, video_input, None, chunk_size, verbose, threads, names, index, row)
+        finally:
+            names.release(index)
+            rows.put(row)
+
+    failed = 0
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        # Entries start in file order, so an entry waiting for its name turn never blocks an earlier one
+        futures = {executor.submit(run, index, video_input): video_input for index, video_input in enumerate(video_inputs)}
+        for future in as_completed(futures):
+            try:
+                if not future.result():
+                    failed += 1
+            except Exception as e:
+                failed += 1
+                tqdm.write(f"Error downloading {futures[future]}: {e}")
+
+    tqdm.write(f"\nBatch finished: {len(video_inputs) - failed} of {len(video_inputs)} videos downloaded.")
+    return failed
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Script to download videos from Google Drive.")
-    parser.add_argument("video_input", type=str, help="The Google Drive video link or video ID.")
+    parser.add_argument("video_input", type=str, nargs="?", help="The Google Drive video link or video ID.")
     parser.add_argument("-o", "--output", type=str, help="Optional output file name for the downloaded video (default: video name in gdrive).")
-    parser.add_argument("-c", "--chunk_size", type=int, default=1024, help="Optional chunk size (in bytes) for single-thread download. Default is 1024 bytes.")
+    parser.add_argument("-c", "--chunk_size", type=int, default=65536, help="Optional chunk size (in bytes) for single-thread download. Default is 65536 bytes; values below 8 KiB are slow.")
     parser.add_argument("-t", "--threads", type=int, default=1, help="Number of parallel threads for faster download (default=1).")
+    parser.add_argument("-b", "--batch", type=str, help="Text file with one video link or ID per line to download instead of video_input.")
+    parser.add_argument("--concurrency", type=int, default=2, help="Number of videos downloaded at the same time in batch mode (default=2).")
+    parser.add_argument("--socket_buffer", type=int, default=DEFAULT_SOCKET_BUFFER, help="Socket receive buffer size in bytes (default=0, keeps the OS default and its autotuning). Only useful if net.core.rmem_max allows it.")
     parser.add_argument("-v", "--verbose", action="store_true", help="Enable verbose mode.")
     parser.add_argument("--version", action="version", version="%(prog)s 2.0")
 
     args = parser.parse_args()
-    main(args.video_input, args.output, args.chunk_size, args.verbose, args.threads)
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    if args.batch:
+        if args.video_input or args.output:
+            parser.error("--batch cannot be combined with video_input or --output")
+        failed = batch_main(args.batch, args.chunk_size, args.verbose, args.threads, args.socket_buffer, args.concurrency)
+        sys.exit(1 if failed else 0)
+    elif args.video_input:
+        ok = main(args.video_input, args.output, args.chunk_size, args.verbose, args.threads, args.socket_buffer)
+        sys.exit(0 if ok else 1)
+    else:
+        parser.error("either video_input or --batch is required")